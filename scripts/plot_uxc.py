@@ -28,6 +28,12 @@ def main() -> None:
         default="artifacts/uxc_charts",
         help="Directory to write PNGs",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory to cache prepared price frames as Parquet (requires pyarrow)",
+    )
     args = parser.parse_args()
 
     engine = get_engine()
@@ -35,20 +41,30 @@ def main() -> None:
     if not ok:
         raise SystemExit(f"DB connection failed: {err}")
 
-    daily, monthly, annual_features = prepare_price_frames(engine, start=args.start, end=args.end)
+    _, monthly, annual_features = prepare_price_frames(
+        engine,
+        start=args.start,
+        end=args.end,
+        include_daily=False,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        dtype="float32",  # ample precision for charting
+    )
     if monthly.empty:
         raise SystemExit("No UxC price data returned for the requested range.")
 
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    outputs = []
-    outputs.append(plot_spot_term(monthly, outdir))
-    outputs.append(plot_term_spreads(monthly, outdir))
-    outputs.append(plot_conversion_basis(monthly, outdir))
-    outputs.append(plot_swu_spread(monthly, outdir))
-    outputs.append(plot_rolling_vol(monthly, outdir))
-    outputs.append(plot_forward_curve_heat(monthly, outdir))
+    outputs = [
+        plot_spot_term(monthly, outdir),
+        plot_term_spreads(monthly, outdir),
+        plot_conversion_basis(monthly, outdir),
+        plot_swu_spread(monthly, outdir),
+        plot_rolling_vol(monthly, outdir),
+        plot_forward_curve_heat(monthly, outdir),
+    ]
+    # Charts whose input columns are missing or empty are skipped and return None.
+    outputs = [path for path in outputs if path is not None]
 
     print("Charts written:")
     for path in outputs:
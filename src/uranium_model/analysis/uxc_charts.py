@@ -2,38 +2,139 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 import matplotlib
 
 matplotlib.use("Agg")  # non-interactive backend for CLI/export use
-import matplotlib.pyplot as plt  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+import numpy as np
 import pandas as pd
+from sqlalchemy import text
 
 from uranium_model.data.uxc import build_price_features, load_uxc_prices, to_annual, to_monthly
+from uranium_model.utils.vec import rolling_std, spread_frame
 
+# Part of the price cache key; bump when loading or feature code changes what gets cached.
+PRICE_CACHE_VERSION = 1
 
-def prepare_price_frames(
-    engine, start: Optional[str] = None, end: Optional[str] = None
+
+def _load_price_frames(
+    engine, start: Optional[str], end: Optional[str], include_daily: bool, dtype: Optional[str]
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Fetch UxC prices from daily + month_end and return daily, monthly, annual_with_features."""
-    daily = load_uxc_prices(engine, start=start, end=end, table="daily")
-    month_end = load_uxc_prices(engine, start=start, end=end, table="month_end")
-    monthly = month_end if not month_end.empty else to_monthly(daily)
+    month_end = load_uxc_prices(engine, start=start, end=end, table="month_end", dtype=dtype)
+    daily = pd.DataFrame()
+    if include_daily:
+        daily = load_uxc_prices(engine, start=start, end=end, table="daily", dtype=dtype)
+    if not month_end.empty:
+        monthly = month_end
+    elif include_daily:
+        monthly = to_monthly(daily)
+    else:
+        monthly = load_uxc_prices(engine, start=start, end=end, table="daily", monthly=True, dtype=dtype)
+        monthly.index.name = "month"
     annual = to_annual(monthly)
     annual_features = build_price_features(annual)
     return daily, monthly, annual_features
 
 
+def _price_cache_paths(
+    engine,
+    start: Optional[str],
+    end: Optional[str],
+    include_daily: bool,
+    dtype: Optional[str],
+    cache_dir: Path,
+) -> Dict[str, Path]:
+    """Cache file per frame, keyed on the request and the latest loaded UxC dates."""
+    with engine.connect() as conn:
+        latest = conn.execute(
+            text("select (select max(date) from uxc.month_end), (select max(date) from uxc.daily)")
+        ).one()
+    key = (
+        PRICE_CACHE_VERSION,
+        engine.url.render_as_string(hide_password=True),
+        start,
+        end,
+        include_daily,
+        dtype,
+        *map(str, latest),
+    )
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+    return {name: cache_dir / f"uxc_{digest}_{name}.parquet" for name in ("daily", "monthly", "annual")}
+
+
+def prepare_price_frames(
+    engine,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    include_daily: bool = True,
+    cache_dir: Optional[Path] = None,
+    dtype: Optional[str] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Fetch UxC prices from daily + month_end and return daily, monthly, annual_with_features.
+
+    With ``include_daily=False`` the daily frame is returned empty and, when month_end has no
+    rows, monthly averages of the daily table are computed in the database instead.
+
+    If ``cache_dir`` is given, the three frames are cached there as Parquet (requires pyarrow)
+    and reused until new UxC rows are loaded.
+
+    ``dtype`` (e.g. ``"float32"``) is passed to ``load_uxc_prices`` to narrow the price columns.
+    """
+    if cache_dir is None:
+        return _load_price_frames(engine, start, end, include_daily, dtype)
+
+    paths = _price_cache_paths(engine, start, end, include_daily, dtype, Path(cache_dir))
+    if all(path.exists() for path in paths.values()):
+        try:
+            return tuple(pd.read_parquet(paths[name]) for name in ("daily", "monthly", "annual"))
+        except Exception as exc:  # noqa: BLE001 - unreadable cache is a miss
+            logging.warning("Ignoring unreadable price frame cache: %s", exc)
+
+    frames = _load_price_frames(engine, start, end, include_daily, dtype)
+    try:
+        _ensure_dir(Path(cache_dir))
+        for name, frame in zip(("daily", "monthly", "annual"), frames):
+            # Write beside the target and rename, so a partial file never sits at the final path.
+            tmp = paths[name].with_name(f"{paths[name].name}.{os.getpid()}.tmp")
+            try:
+                frame.to_parquet(tmp, compression="zstd")
+                os.replace(tmp, paths[name])
+            finally:
+                tmp.unlink(missing_ok=True)
+    except ImportError as exc:
+        logging.warning("Price frame cache disabled: %s", exc)
+    return frames
+
+
 def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def plot_spot_term(monthly: pd.DataFrame, outdir: Path) -> Path:
+def _has_data(df: pd.DataFrame, cols: Iterable[str]) -> bool:
+    """True when every column exists and has at least one non-null value."""
+    return all(c in df.columns and df[c].notna().any() for c in cols)
+
+
+def _make_fig(figsize: Tuple[float, float]):
+    """Standalone Agg figure; skips pyplot's global figure manager, so no close() is needed."""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+def plot_spot_term(monthly: pd.DataFrame, outdir: Path) -> Optional[Path]:
     """Spot vs term curve (3y/5y/LT)."""
+    if not _has_data(monthly, ["u3o8_spot", "yr_3_fwd_u3o8", "yr_5_fwd_u3o8", "lt_u3o8"]):
+        return None
     _ensure_dir(outdir)
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = _make_fig((10, 5))
     monthly[["u3o8_spot", "yr_3_fwd_u3o8", "yr_5_fwd_u3o8", "lt_u3o8"]].plot(ax=ax)
     ax.set_title("U₃O₈ Spot vs Term")
     ax.set_ylabel("USD/lb")
@@ -43,19 +144,24 @@ def plot_spot_term(monthly: pd.DataFrame, outdir: Path) -> Path:
     outpath = outdir / "u3o8_spot_term.png"
     fig.tight_layout()
     fig.savefig(outpath, dpi=200)
-    plt.close(fig)
     return outpath
 
 
-def plot_term_spreads(monthly: pd.DataFrame, outdir: Path) -> Path:
+def plot_term_spreads(monthly: pd.DataFrame, outdir: Path) -> Optional[Path]:
     """Term spreads vs spot."""
+    if not _has_data(monthly, ["u3o8_spot", "yr_3_fwd_u3o8", "yr_5_fwd_u3o8", "lt_u3o8"]):
+        return None
     _ensure_dir(outdir)
-    spreads = pd.DataFrame(index=monthly.index)
-    spreads["3y_spread"] = monthly["yr_3_fwd_u3o8"] - monthly["u3o8_spot"]
-    spreads["5y_spread"] = monthly["yr_5_fwd_u3o8"] - monthly["u3o8_spot"]
-    spreads["lt_spread"] = monthly["lt_u3o8"] - monthly["u3o8_spot"]
+    spreads = spread_frame(
+        monthly,
+        {
+            "3y_spread": ("yr_3_fwd_u3o8", "u3o8_spot"),
+            "5y_spread": ("yr_5_fwd_u3o8", "u3o8_spot"),
+            "lt_spread": ("lt_u3o8", "u3o8_spot"),
+        },
+    )
 
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _make_fig((10, 4))
     spreads.plot(ax=ax)
     ax.axhline(0, color="black", linewidth=1)
     ax.set_title("Term Spreads vs Spot (U₃O₈)")
@@ -65,18 +171,17 @@ def plot_term_spreads(monthly: pd.DataFrame, outdir: Path) -> Path:
     outpath = outdir / "u3o8_term_spreads.png"
     fig.tight_layout()
     fig.savefig(outpath, dpi=200)
-    plt.close(fig)
     return outpath
 
 
-def plot_conversion_basis(monthly: pd.DataFrame, outdir: Path) -> Path:
+def plot_conversion_basis(monthly: pd.DataFrame, outdir: Path) -> Optional[Path]:
     """Conversion basis (NA/EU spot vs LT)."""
+    if not _has_data(monthly, ["na_conv", "na_lt_conv", "eu_conv", "eu_lt_conv"]):
+        return None
     _ensure_dir(outdir)
-    basis = pd.DataFrame(index=monthly.index)
-    basis["NA basis"] = monthly["na_conv"] - monthly["na_lt_conv"]
-    basis["EU basis"] = monthly["eu_conv"] - monthly["eu_lt_conv"]
+    basis = spread_frame(monthly, {"NA basis": ("na_conv", "na_lt_conv"), "EU basis": ("eu_conv", "eu_lt_conv")})
 
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _make_fig((10, 4))
     basis.plot(ax=ax)
     ax.axhline(0, color="black", linewidth=1)
     ax.set_title("Conversion Basis (Spot - LT)")
@@ -86,14 +191,15 @@ def plot_conversion_basis(monthly: pd.DataFrame, outdir: Path) -> Path:
     outpath = outdir / "conversion_basis.png"
     fig.tight_layout()
     fig.savefig(outpath, dpi=200)
-    plt.close(fig)
     return outpath
 
 
-def plot_swu_spread(monthly: pd.DataFrame, outdir: Path) -> Path:
+def plot_swu_spread(monthly: pd.DataFrame, outdir: Path) -> Optional[Path]:
     """SWU spot vs LT and spread."""
+    if not _has_data(monthly, ["spot_swu", "lt_swu"]):
+        return None
     _ensure_dir(outdir)
-    fig, ax1 = plt.subplots(figsize=(10, 4))
+    fig, ax1 = _make_fig((10, 4))
     monthly[["spot_swu", "lt_swu"]].plot(ax=ax1)
     ax1.set_title("SWU Spot vs LT")
     ax1.set_ylabel("USD/SWU")
@@ -103,10 +209,9 @@ def plot_swu_spread(monthly: pd.DataFrame, outdir: Path) -> Path:
     outpath1 = outdir / "swu_spot_lt.png"
     fig.tight_layout()
     fig.savefig(outpath1, dpi=200)
-    plt.close(fig)
 
-    spread = (monthly["lt_swu"] - monthly["spot_swu"]).to_frame("lt_minus_spot")
-    fig2, ax2 = plt.subplots(figsize=(10, 3))
+    spread = spread_frame(monthly, {"lt_minus_spot": ("lt_swu", "spot_swu")})
+    fig2, ax2 = _make_fig((10, 3))
     spread.plot(ax=ax2, color="purple")
     ax2.axhline(0, color="black", linewidth=1)
     ax2.set_title("SWU LT - Spot")
@@ -116,17 +221,21 @@ def plot_swu_spread(monthly: pd.DataFrame, outdir: Path) -> Path:
     outpath2 = outdir / "swu_spread.png"
     fig2.tight_layout()
     fig2.savefig(outpath2, dpi=200)
-    plt.close(fig2)
     return outpath2
 
 
-def plot_rolling_vol(monthly: pd.DataFrame, outdir: Path, window: int = 6) -> Path:
+def plot_rolling_vol(monthly: pd.DataFrame, outdir: Path, window: int = 6) -> Optional[Path]:
     """Rolling volatility of spot prices (monthly pct change std)."""
+    if not _has_data(monthly, ["u3o8_spot"]):
+        return None
     _ensure_dir(outdir)
-    ret = monthly["u3o8_spot"].pct_change()
-    vol = (ret.rolling(window=window).std() * (12 ** 0.5)).to_frame("ann_vol")
+    # Pad gaps before taking returns, as pct_change's default fill_method did on pandas 2.x.
+    prices = monthly["u3o8_spot"].ffill().to_numpy(dtype=float)
+    ret = np.full(len(prices), np.nan)
+    ret[1:] = prices[1:] / prices[:-1] - 1
+    vol = pd.DataFrame({"ann_vol": rolling_std(ret, window) * (12 ** 0.5)}, index=monthly.index)
 
-    fig, ax = plt.subplots(figsize=(10, 3))
+    fig, ax = _make_fig((10, 3))
     vol.plot(ax=ax, color="darkgreen")
     ax.set_title(f"U₃O₈ Spot Rolling Vol ({window}m window, annualized)")
     ax.set_ylabel("Volatility")
@@ -135,22 +244,23 @@ def plot_rolling_vol(monthly: pd.DataFrame, outdir: Path, window: int = 6) -> Pa
     outpath = outdir / "u3o8_spot_rolling_vol.png"
     fig.tight_layout()
     fig.savefig(outpath, dpi=200)
-    plt.close(fig)
     return outpath
 
 
-def plot_forward_curve_heat(monthly: pd.DataFrame, outdir: Path) -> Path:
+def plot_forward_curve_heat(monthly: pd.DataFrame, outdir: Path) -> Optional[Path]:
     """Heatmap of forward premia/discount vs spot."""
+    if not _has_data(monthly, ["u3o8_spot", "yr_3_fwd_u3o8", "yr_5_fwd_u3o8", "lt_u3o8"]):
+        return None
     _ensure_dir(outdir)
-    spreads = pd.DataFrame(
+    spreads = spread_frame(
+        monthly,
         {
-            "3y": monthly["yr_3_fwd_u3o8"] - monthly["u3o8_spot"],
-            "5y": monthly["yr_5_fwd_u3o8"] - monthly["u3o8_spot"],
-            "lt": monthly["lt_u3o8"] - monthly["u3o8_spot"],
+            "3y": ("yr_3_fwd_u3o8", "u3o8_spot"),
+            "5y": ("yr_5_fwd_u3o8", "u3o8_spot"),
+            "lt": ("lt_u3o8", "u3o8_spot"),
         },
-        index=monthly.index,
     )
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig, ax = _make_fig((10, 4))
     cax = ax.imshow(spreads.T, aspect="auto", interpolation="nearest", cmap="coolwarm", origin="lower")
     ax.set_yticks(range(len(spreads.columns)))
     ax.set_yticklabels(spreads.columns)
@@ -160,5 +270,4 @@ def plot_forward_curve_heat(monthly: pd.DataFrame, outdir: Path) -> Path:
     outpath = outdir / "u3o8_forward_heat.png"
     fig.tight_layout()
     fig.savefig(outpath, dpi=200)
-    plt.close(fig)
     return outpath
@@ -14,8 +14,14 @@ Env vars:
 from __future__ import annotations
 
 import os
-from typing import Optional
-
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
@@ -28,6 +34,22 @@ except Exception:
     # Dependency may be absent in some environments; ignore quietly.
     pass
 
+try:
+    # Arrow-native Postgres driver (``arrow`` extra); read_sql_arrow is a no-op without it.
+    import pyarrow as pa
+    from adbc_driver_postgresql import dbapi as adbc_postgresql
+except ImportError:
+    adbc_postgresql = None
+
+# Named bind parameters as recognized by SQLAlchemy's text() (``::type`` casts are not params).
+_BIND_PARAM = re.compile(r"(?<![:\w\\]):(\w+)(?!:)")
+
+# Idle ADBC connections per URI as (connection, opened_at); sized and recycled like the engine pool.
+_ADBC_IDLE: Dict[str, List[Tuple[Any, float]]] = {}
+_ADBC_LOCK = threading.Lock()
+_ADBC_MAX_IDLE = 5
+_ADBC_RECYCLE_SECONDS = 1800
+
 
 def build_connection_url() -> str:
     """Build SQLAlchemy connection URL from env vars or return CHRONO_DB_URL."""
@@ -56,15 +78,29 @@ def build_connection_url() -> str:
     return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}"
 
 
+@lru_cache(maxsize=8)
+def _cached_engine(url: str, echo: bool, pool_pre_ping: bool) -> Engine:
+    return create_engine(
+        url,
+        echo=echo,
+        pool_pre_ping=pool_pre_ping,
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=1800,  # drop connections before server/proxy idle timeouts do
+        pool_use_lifo=True,  # reuse the most recently returned (still warm) connection
+    )
+
+
 def get_engine(echo: bool = False, pool_pre_ping: bool = True) -> Engine:
-    """Create a SQLAlchemy engine using Chrono DB env vars."""
-    url = build_connection_url()
-    engine = create_engine(url, echo=echo, pool_pre_ping=pool_pre_ping)
-    return engine
+    """Return a SQLAlchemy engine using Chrono DB env vars.
+
+    Engines are cached per (url, echo, pool_pre_ping), so repeated calls share one connection pool.
+    """
+    return _cached_engine(build_connection_url(), echo, pool_pre_ping)
 
 
 def test_connection(engine: Optional[Engine] = None) -> tuple[bool, Optional[str]]:
-    """Execute a simple SELECT 1 to verify connectivity."""
+    """Execute a simple SELECT 1 to verify connectivity (defaults to the shared engine)."""
     eng = engine or get_engine()
     try:
         with eng.connect() as conn:
@@ -72,3 +108,63 @@ def test_connection(engine: Optional[Engine] = None) -> tuple[bool, Optional[str
         return True, None
     except Exception as exc:  # noqa: BLE001 - forward message
         return False, str(exc)
+
+
+@contextmanager
+def _adbc_connection(uri: str) -> Iterator[Any]:
+    """Check out an idle ADBC connection for ``uri`` (or open one) and return it afterwards."""
+    conn = None
+    with _ADBC_LOCK:
+        idle = _ADBC_IDLE.setdefault(uri, [])
+        while idle and conn is None:
+            candidate, opened_at = idle.pop()
+            if time.monotonic() - opened_at < _ADBC_RECYCLE_SECONDS:
+                conn = candidate
+                break
+            candidate.close()
+    if conn is None:
+        conn, opened_at = adbc_postgresql.connect(uri, autocommit=True), time.monotonic()
+    try:
+        yield conn
+    except Exception:
+        conn.close()
+        raise
+    with _ADBC_LOCK:
+        idle = _ADBC_IDLE[uri]
+        if len(idle) < _ADBC_MAX_IDLE:
+            idle.append((conn, opened_at))
+            conn = None
+    if conn is not None:
+        conn.close()
+
+
+def read_sql_arrow(engine: Engine, sql: str, params: Optional[Dict[str, Any]] = None) -> Optional[pd.DataFrame]:
+    """Run a ``:name``-parameterized query via ADBC, converting the Arrow result to pandas.
+
+    Skips psycopg2's per-row Python objects. Returns None when the ADBC Postgres driver is not
+    installed or the engine is not Postgres, so callers can fall back to ``pd.read_sql_query``.
+
+    Decimal fields are cast to float64, as ``read_sql_query(coerce_float=True)`` does. The driver
+    may still return NUMERIC as strings, so callers should coerce columns they know are numeric.
+    ADBC connections are kept apart from the engine's SQLAlchemy pool: idle ones are reused per
+    URL (concurrent callers each check out their own) and reopened after 30 minutes.
+    """
+    if adbc_postgresql is None or engine.dialect.name != "postgresql":
+        return None
+
+    params = params or {}
+    names: List[str] = []
+
+    def _positional(match: re.Match) -> str:
+        names.append(match.group(1))
+        return f"${len(names)}"
+
+    query = _BIND_PARAM.sub(_positional, sql)
+    uri = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    with _adbc_connection(uri) as conn, conn.cursor() as cur:
+        cur.execute(query, [params[name] for name in names] or None)
+        table = cur.fetch_arrow_table()
+    for i, field in enumerate(table.schema):
+        if pa.types.is_decimal(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table.to_pandas()
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import pandas as pd
 
+from uranium_model.utils.vec import downcast
+
 
 def build_sd_panel(
     feed_demand: pd.DataFrame,
@@ -12,33 +14,30 @@ def build_sd_panel(
     inventories: pd.DataFrame,
     conv_balance: pd.DataFrame | None = None,
     enr_balance: pd.DataFrame | None = None,
+    dtype: str | None = None,
 ) -> pd.DataFrame:
-    """Build annual supply/demand panel."""
-    df = feed_demand[["year", "feed_tu"]].copy()
-
-    df = df.merge(primary_supply.rename(columns={"primary_supply_tu": "primary_supply_tu"}), on="year", how="left")
-    df = df.merge(secondary_supply.rename(columns={"secondary_supply_tu": "secondary_supply_tu"}), on="year", how="left")
+    """Build annual supply/demand panel, optionally narrowed to ``dtype`` (e.g. "float32")."""
+    # All inputs share the year key; align them in one concat.
+    feed = feed_demand[["year", "feed_tu"]].set_index("year")
+    parts = [feed, primary_supply.set_index("year"), secondary_supply.set_index("year")]
     if inventories is not None and not inventories.empty:
-        df = df.merge(inventories.rename(columns={"inventory_tu": "inventory_tu"}), on="year", how="left")
+        parts.append(inventories.set_index("year"))
     else:
-        df["inventory_tu"] = 0.0
-
+        parts.append(pd.DataFrame({"inventory_tu": 0.0}, index=feed.index))
     if conv_balance is not None and not conv_balance.empty:
-        df = df.merge(
-            conv_balance[["year", "conv_balance_ratio", "conv_spare_tu"]], on="year", how="left"
-        )
+        parts.append(conv_balance.set_index("year")[["conv_balance_ratio", "conv_spare_tu"]])
     if enr_balance is not None and not enr_balance.empty:
-        df = df.merge(
-            enr_balance[["year", "swu_balance_ratio", "swu_spare_swu"]], on="year", how="left"
-        )
+        parts.append(enr_balance.set_index("year")[["swu_balance_ratio", "swu_spare_swu"]])
+
+    df = pd.concat(parts, axis=1).reindex(feed.index).reset_index()
 
     df["primary_supply_tu"] = df["primary_supply_tu"].fillna(0.0)
     df["secondary_supply_tu"] = df["secondary_supply_tu"].fillna(0.0)
     df["total_supply_tu"] = df["primary_supply_tu"] + df["secondary_supply_tu"]
     df["balance_tu"] = df["total_supply_tu"] - df["feed_tu"]
     df["balance_ratio"] = df["total_supply_tu"] / df["feed_tu"]
-    df["inventory_tu"] = df["inventory_tu"].fillna(method="ffill").fillna(0.0)
+    df["inventory_tu"] = df["inventory_tu"].ffill().fillna(0.0)
     df["inventory_years"] = df["inventory_tu"] / df["feed_tu"]
 
     df["year"] = df["year"].astype(int)
-    return df.sort_values("year").reset_index(drop=True)
+    return downcast(df.sort_values("year").reset_index(drop=True), dtype)
@@ -7,17 +7,37 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
-
-def _lookup_params(fuel_params: pd.DataFrame, reactor_type: str, column: str, default: float) -> float:
-    if fuel_params is None or fuel_params.empty:
-        return default
-    if "reactor_type" not in fuel_params.columns:
-        return default
-    row = fuel_params[fuel_params["reactor_type"] == reactor_type]
-    if row.empty or column not in fuel_params.columns:
-        return default
-    value = row.iloc[0][column]
-    return float(value) if not pd.isna(value) else default
+from uranium_model.utils.vec import downcast
+
+
+# Fuel-parameter columns consumed per reactor type, with fallbacks for missing types/values.
+_FUEL_PARAM_DEFAULTS = {
+    "default_capacity_factor": 0.85,
+    "first_core_tu_per_gwe": 0.0,
+    "reload_tu_per_gwe_year": 0.0,
+    "product_assay": 0.045,
+    "tails_assay": 0.0025,
+}
+
+
+def _attach_fuel_params(reactors: pd.DataFrame, fuel_params: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Join per-type fuel parameters onto reactors once, filling defaults."""
+    if (
+        fuel_params is not None
+        and not fuel_params.empty
+        and "reactor_type" in fuel_params.columns
+        and "reactor_type" in reactors.columns
+    ):
+        cols = [c for c in _FUEL_PARAM_DEFAULTS if c in fuel_params.columns]
+        params = fuel_params[["reactor_type"] + cols].drop_duplicates("reactor_type")
+        reactors = reactors.merge(params, on="reactor_type", how="left")
+
+    for col, default in _FUEL_PARAM_DEFAULTS.items():
+        if col in reactors.columns:
+            reactors[col] = pd.to_numeric(reactors[col], errors="coerce").fillna(default)
+        else:
+            reactors[col] = default
+    return reactors
 
 
 def _apply_life_overrides(
@@ -79,76 +99,74 @@ def compute_reactor_demand(
     start_year: int,
     end_year: int,
     scenario_name: str,
+    dtype: Optional[str] = None,
 ) -> pd.DataFrame:
-    """Compute reactor product demand (tU) by reactor-year."""
+    """Compute reactor product demand (tU) by reactor-year.
+
+    Pass ``dtype="float32"`` to narrow the float columns (and ``year`` to int32).
+    """
     reactors = _apply_life_overrides(reactor_master, reactor_life_scenarios, scenario_name)
     reactors = _append_newbuilds(reactors, newbuild_projects, scenario_name)
 
     reactors["commercial_operation_date"] = pd.to_datetime(reactors["commercial_operation_date"], errors="coerce")
     reactors["permanent_shutdown_date"] = pd.to_datetime(reactors["permanent_shutdown_date"], errors="coerce")
     reactors["start_year"] = reactors["commercial_operation_date"].dt.year
-    reactors["shutdown_year"] = reactors["shutdown_year_override"].fillna(
-        reactors["permanent_shutdown_date"].dt.year
-    )
-    reactors["shutdown_year"] = reactors["shutdown_year"].fillna(end_year).astype(int)
-
-    gen_lookup = (
-        reactor_generation.set_index(["reactor_id", "year"])
-        if not reactor_generation.empty
-        else pd.DataFrame()
+    shutdown_year = reactors["permanent_shutdown_date"].dt.year
+    if "shutdown_year_override" in reactors.columns:
+        shutdown_year = reactors["shutdown_year_override"].fillna(shutdown_year)
+    reactors["shutdown_year"] = shutdown_year.fillna(end_year).astype(int)
+
+    # Reactors without a commercial operation date never enter the demand panel.
+    reactors = reactors[reactors["start_year"].notna()].reset_index(drop=True)
+    reactors = _attach_fuel_params(reactors, reactor_fuel_params)
+
+    start = reactors["start_year"].to_numpy(dtype=np.int64)
+    first_year = np.maximum(start, start_year)
+    last_year = np.minimum(reactors["shutdown_year"].to_numpy(dtype=np.int64), end_year)
+    n_years = np.clip(last_year - first_year + 1, 0, None)
+
+    # Explode to one row per operating reactor-year: repeat each reactor index by its
+    # operating span and add within-reactor offsets to its first year.
+    idx = np.repeat(np.arange(len(reactors)), n_years)
+    offsets = np.arange(idx.size) - np.repeat(np.cumsum(n_years) - n_years, n_years)
+    years = first_year[idx] + offsets
+
+    panel = pd.DataFrame(
+        {
+            "reactor_id": reactors["reactor_id"].to_numpy()[idx],
+            "year": years,
+            "country": reactors["country"].to_numpy()[idx],
+        }
     )
 
-    rows = []
-    for _, r in reactors.iterrows():
-        rid = r["reactor_id"]
-        country = r.get("country")
-        reactor_type = r.get("reactor_type")
-        net_mwe = r.get("net_mwe", np.nan)
-        start = int(r.get("start_year", start_year))
-        shutdown = int(r.get("shutdown_year", end_year))
-
-        for year in range(max(start, start_year), end_year + 1):
-            if year > shutdown:
-                break
-
-            net_gwe = float(net_mwe) / 1000 if not pd.isna(net_mwe) else np.nan
-            # Actual CF if generation available; fallback to fuel param default.
-            cf_default = _lookup_params(reactor_fuel_params, reactor_type, "default_capacity_factor", 0.85)
-            if not gen_lookup.empty and (rid, year) in gen_lookup.index:
-                gen_row = gen_lookup.loc[(rid, year)]
-                gen_gwh = float(gen_row.get("net_generation_gwh", np.nan))
-                if pd.isna(net_mwe) or net_mwe == 0:
-                    cf = cf_default
-                else:
-                    denom = net_mwe * 8760 / 1000
-                    cf = (gen_gwh / denom) if denom else 0.0
-            else:
-                cf = cf_default
-
-            gw_years = net_gwe * cf if not pd.isna(net_gwe) else np.nan
-
-            first_core_factor = _lookup_params(reactor_fuel_params, reactor_type, "first_core_tu_per_gwe", 0.0)
-            reload_factor = _lookup_params(reactor_fuel_params, reactor_type, "reload_tu_per_gwe_year", 0.0)
-            product_assay = _lookup_params(reactor_fuel_params, reactor_type, "product_assay", 0.045)
-            tails_assay = _lookup_params(reactor_fuel_params, reactor_type, "tails_assay", 0.0025)
-
-            is_first_core = year == start
-            first_core_tu = first_core_factor * net_gwe if is_first_core and not pd.isna(net_gwe) else 0.0
-            reload_tu = reload_factor * gw_years if gw_years is not None and not pd.isna(gw_years) else 0.0
-            total_tu = first_core_tu + reload_tu
-
-            rows.append(
-                {
-                    "reactor_id": rid,
-                    "year": year,
-                    "country": country,
-                    "gw_years": gw_years,
-                    "first_core_tu": first_core_tu,
-                    "reload_tu": reload_tu,
-                    "total_tu": total_tu,
-                    "product_assay": product_assay,
-                    "tails_assay": tails_assay,
-                }
-            )
-
-    return pd.DataFrame(rows)
+    net_mwe = pd.to_numeric(reactors["net_mwe"], errors="coerce").to_numpy(dtype=float)[idx]
+    net_gwe = net_mwe / 1000
+
+    def _param(col: str) -> np.ndarray:
+        return np.asarray(reactors[col].to_numpy(dtype=float)[idx], dtype=float)
+
+    # Actual CF if generation available; fallback to fuel param default.
+    cf = _param("default_capacity_factor")
+    if not reactor_generation.empty:
+        gen = reactor_generation[["reactor_id", "year", "net_generation_gwh"]].drop_duplicates(
+            ["reactor_id", "year"]
+        )
+        matched = panel[["reactor_id", "year"]].merge(gen, on=["reactor_id", "year"], how="left", indicator=True)
+        has_gen = (matched["_merge"] == "both").to_numpy()
+        gen_gwh = pd.to_numeric(matched["net_generation_gwh"], errors="coerce").to_numpy(dtype=float)
+        use_actual = has_gen & ~np.isnan(net_mwe) & (net_mwe != 0)
+        np.divide(gen_gwh, net_mwe * 8760 / 1000, out=cf, where=use_actual)
+
+    gw_years = net_gwe * cf
+
+    is_first_core = (years == start[idx]) & ~np.isnan(net_gwe)
+    first_core_tu = np.where(is_first_core, _param("first_core_tu_per_gwe") * net_gwe, 0.0)
+    reload_tu = np.where(np.isnan(gw_years), 0.0, _param("reload_tu_per_gwe_year") * gw_years)
+
+    panel["gw_years"] = gw_years
+    panel["first_core_tu"] = first_core_tu
+    panel["reload_tu"] = reload_tu
+    panel["total_tu"] = first_core_tu + reload_tu
+    panel["product_assay"] = _param("product_assay")
+    panel["tails_assay"] = _param("tails_assay")
+    return downcast(panel, dtype)
@@ -9,9 +9,14 @@ import numpy as np
 import pandas as pd
 
 from uranium_model.config.constants import DEFAULT_TAILS_ASSAY, NATURAL_U235_ASSAY
+from uranium_model.utils.vec import downcast
 
+# Default tails-assay search window and resolution for cost optimization.
+TAILS_SEARCH_BOUNDS: tuple[float, float] = (0.001, 0.003)
+TAILS_GRID_POINTS = 40
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EnrichmentParams:
     feed_assay: float = NATURAL_U235_ASSAY
     product_assay: float = 0.045  # 4.5% LEU
@@ -23,45 +28,66 @@ def value_function(x: float) -> float:
     return (1 - 2 * x) * np.log((1 - x) / x)
 
 
-def feed_and_swu_for_product(product_tu: float, params: EnrichmentParams) -> tuple[float, float]:
-    """Given product mass (tU) and enrichment assays, compute feed (tU) and SWU."""
-    xf = params.feed_assay
-    xp = params.product_assay
-    xt = params.tails_assay
-
-    p = product_tu
+def _feed_and_swu(product_tu, xf, xp, xt):
+    """Feed (tU) and SWU from plain assays; accepts floats or broadcastable arrays."""
     feed_over_product = (xp - xt) / (xf - xt)
-    f_mass = feed_over_product * p
-    w_mass = f_mass - p
+    f_mass = feed_over_product * product_tu
+    w_mass = f_mass - product_tu
 
-    swu = p * value_function(xp) + w_mass * value_function(xt) - f_mass * value_function(xf)
+    swu = product_tu * value_function(xp) + w_mass * value_function(xt) - f_mass * value_function(xf)
     return f_mass, swu
 
 
+def feed_and_swu_for_product(product_tu: float, params: EnrichmentParams) -> tuple[float, float]:
+    """Given product mass (tU) and enrichment assays, compute feed (tU) and SWU."""
+    feed, swu = _feed_and_swu(product_tu, params.feed_assay, params.product_assay, params.tails_assay)
+    return float(feed), float(swu)
+
+
+def _optimal_tails_grid(
+    u_price: np.ndarray,
+    swu_price: np.ndarray,
+    product_assay: np.ndarray,
+    feed_assay: float,
+    bounds: tuple[float, float],
+    grid_points: int,
+) -> np.ndarray:
+    """Cost-minimizing tails assay per element, searched over one broadcast (N, grid) grid."""
+    tails_grid = np.linspace(bounds[0], bounds[1], grid_points)
+    xp = np.asarray(product_assay, dtype=float)[:, None]
+    # Note: cost units are informal; feed_tu is not converted to lbs. This is relative only.
+    feed_tu, swu = _feed_and_swu(1.0, feed_assay, xp, tails_grid[None, :])
+    cost = np.asarray(u_price, dtype=float)[:, None] * feed_tu + np.asarray(swu_price, dtype=float)[:, None] * swu
+    return np.asarray(tails_grid[np.argmin(cost, axis=1)], dtype=float)
+
+
 def optimize_tails_assay(
     u_price_usd_per_lb: float,
     swu_price_usd_per_swu: float,
     product_assay: float,
     feed_assay: float = NATURAL_U235_ASSAY,
-    bounds: tuple[float, float] = (0.001, 0.003),
-    grid_points: int = 40,
+    bounds: tuple[float, float] = TAILS_SEARCH_BOUNDS,
+    grid_points: int = TAILS_GRID_POINTS,
 ) -> float:
     """Grid search tails assay that minimizes fuel cost per unit product."""
     if u_price_usd_per_lb is None or swu_price_usd_per_swu is None:
         return DEFAULT_TAILS_ASSAY
 
-    tails_grid = np.linspace(bounds[0], bounds[1], grid_points)
-    best_tails = tails_grid[0]
-    best_cost = float("inf")
-    # Note: cost units are informal; feed_tu is not converted to lbs. This is relative only.
-    for tails in tails_grid:
-        params = EnrichmentParams(feed_assay=feed_assay, product_assay=product_assay, tails_assay=tails)
-        feed_tu, swu = feed_and_swu_for_product(1.0, params)
-        cost = u_price_usd_per_lb * feed_tu + swu_price_usd_per_swu * swu
-        if cost < best_cost:
-            best_cost = cost
-            best_tails = tails
-    return float(best_tails)
+    best_tails = _optimal_tails_grid(
+        np.array([u_price_usd_per_lb]),
+        np.array([swu_price_usd_per_swu]),
+        np.array([product_assay]),
+        feed_assay=feed_assay,
+        bounds=bounds,
+        grid_points=grid_points,
+    )
+    return float(best_tails[0])
+
+
+def _align_prices(prices: Optional[pd.Series], years: np.ndarray) -> np.ndarray:
+    if prices is None:
+        return np.full(len(years), np.nan)
+    return np.asarray(prices.reindex(years).to_numpy(dtype=float), dtype=float)
 
 
 def compute_feed_and_swu_demand(
@@ -71,8 +97,12 @@ def compute_feed_and_swu_demand(
     tails_policy: Literal["optimize", "fixed"] = "optimize",
     default_tails: float = DEFAULT_TAILS_ASSAY,
     feed_assay: float = NATURAL_U235_ASSAY,
+    dtype: Optional[str] = None,
 ) -> pd.DataFrame:
-    """Aggregate reactor product demand into feed and SWU demand by year."""
+    """Aggregate reactor product demand into feed and SWU demand by year.
+
+    Tails are optimized in float64; ``dtype`` only narrows the returned frame.
+    """
     if reactor_demand.empty:
         return pd.DataFrame(columns=["year", "product_tu", "feed_tu", "swu_demand_swu", "tails_assay_used"])
 
@@ -86,37 +116,36 @@ def compute_feed_and_swu_demand(
         .reset_index()
     )
 
-    feed_list = []
-    for _, row in yearly.iterrows():
-        year = int(row["year"])
-        product_tu = float(row["product_tu"])
-        product_assay = float(row.get("product_assay", 0.045))
-        fallback_tails = float(row.get("fallback_tails", default_tails))
-
-        u_price = u_price_series.get(year, np.nan) if u_price_series is not None else np.nan
-        swu_price = swu_price_series.get(year, np.nan) if swu_price_series is not None else np.nan
-
-        if tails_policy == "optimize" and pd.notna(u_price) and pd.notna(swu_price):
-            tails = optimize_tails_assay(
-                u_price_usd_per_lb=float(u_price),
-                swu_price_usd_per_swu=float(swu_price),
-                product_assay=product_assay,
+    years = yearly["year"].to_numpy(dtype=int)
+    product_tu = yearly["product_tu"].to_numpy(dtype=float)
+    product_assay = yearly["product_assay"].to_numpy(dtype=float)
+    fallback_tails = yearly["fallback_tails"].to_numpy(dtype=float)
+    tails = np.where(np.isnan(fallback_tails), default_tails, fallback_tails)
+
+    if tails_policy == "optimize":
+        u_price = _align_prices(u_price_series, years)
+        swu_price = _align_prices(swu_price_series, years)
+        priced = ~np.isnan(u_price) & ~np.isnan(swu_price)
+        if priced.any():
+            optimized = _optimal_tails_grid(
+                u_price,
+                swu_price,
+                product_assay,
                 feed_assay=feed_assay,
+                bounds=TAILS_SEARCH_BOUNDS,
+                grid_points=TAILS_GRID_POINTS,
             )
-        else:
-            tails = fallback_tails if not np.isnan(fallback_tails) else default_tails
-
-        params = EnrichmentParams(feed_assay=feed_assay, product_assay=product_assay, tails_assay=tails)
-        feed_tu, swu = feed_and_swu_for_product(product_tu, params)
-
-        feed_list.append(
-            {
-                "year": year,
-                "product_tu": product_tu,
-                "feed_tu": feed_tu,
-                "swu_demand_swu": swu,
-                "tails_assay_used": tails,
-            }
-        )
-
-    return pd.DataFrame(feed_list)
+            tails = np.where(priced, optimized, tails)
+
+    feed_tu, swu = _feed_and_swu(product_tu, feed_assay, product_assay, tails)
+
+    out = pd.DataFrame(
+        {
+            "year": years,
+            "product_tu": product_tu,
+            "feed_tu": feed_tu,
+            "swu_demand_swu": swu,
+            "tails_assay_used": tails,
+        }
+    )
+    return downcast(out, dtype)
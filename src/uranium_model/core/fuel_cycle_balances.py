@@ -2,18 +2,44 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from uranium_model.utils.vec import downcast
+
 
 def _apply_capacity_scenarios(base: pd.DataFrame, scenarios: pd.DataFrame | None, start_year: int, end_year: int) -> pd.DataFrame:
-    cap = base.copy()
-    cap = cap[(cap["year"] >= start_year) & (cap["year"] <= end_year)]
+    """Sum base and scenario capacity rows onto a dense ``start_year..end_year`` grid."""
+    years = np.arange(start_year, end_year + 1)
+    frames = [base]
     if scenarios is not None and not scenarios.empty:
-        scen = scenarios[(scenarios["year"] >= start_year) & (scenarios["year"] <= end_year)]
-        if not scen.empty:
-            cap = pd.concat([cap, scen], ignore_index=True, sort=False)
-    cap = cap.groupby("year").sum(numeric_only=True).reset_index()
-    return cap
+        frames.append(scenarios)
+
+    value_cols = list(
+        dict.fromkeys(c for frame in frames for c in frame.select_dtypes("number").columns if c != "year")
+    )
+    totals = {col: np.zeros(len(years)) for col in value_cols}
+    for frame in frames:
+        frame_years = frame["year"].to_numpy()
+        in_range = (frame_years >= start_year) & (frame_years <= end_year)
+        offsets = (frame_years[in_range] - start_year).astype(np.int64)
+        for col in value_cols:
+            if col not in frame.columns:
+                continue
+            values = np.nan_to_num(frame[col].to_numpy(dtype=float)[in_range])
+            totals[col] += np.bincount(offsets, weights=values, minlength=len(years))
+    return pd.DataFrame({"year": years, **totals})
+
+
+def _capacity_by_year(cap: pd.DataFrame, column: str, years: np.ndarray) -> np.ndarray:
+    if column not in cap.columns:
+        return np.zeros(len(years))
+    by_year = cap.set_index("year")[column].reindex(years, fill_value=0.0).fillna(0.0)
+    return np.asarray(by_year.to_numpy(dtype=float), dtype=float)
+
+
+def _capacity_ratio(capacity: np.ndarray, demand: np.ndarray) -> np.ndarray:
+    return np.asarray(np.divide(capacity, demand, out=np.full_like(demand, np.nan), where=demand != 0))
 
 
 def compute_conversion_balance(
@@ -22,18 +48,25 @@ def compute_conversion_balance(
     conv_scenarios: pd.DataFrame | None,
     start_year: int,
     end_year: int,
+    dtype: str | None = None,
 ) -> pd.DataFrame:
-    """Compare UF6 demand to conversion capacity."""
+    """Compare UF6 demand to conversion capacity, optionally narrowed to ``dtype``."""
     cap = _apply_capacity_scenarios(conversion_capacity, conv_scenarios, start_year, end_year)
     feed = feed_demand[(feed_demand["year"] >= start_year) & (feed_demand["year"] <= end_year)]
 
-    df = feed.rename(columns={"feed_tu": "uf6_demand_tu"})[["year", "uf6_demand_tu"]].merge(
-        cap.rename(columns={"conv_capacity_tu": "conv_capacity_tu"}), on="year", how="left"
+    years = feed["year"].to_numpy()
+    demand = feed["feed_tu"].to_numpy(dtype=float)
+    capacity = _capacity_by_year(cap, "conv_capacity_tu", years)
+    out = pd.DataFrame(
+        {
+            "year": years,
+            "uf6_demand_tu": demand,
+            "conv_capacity_tu": capacity,
+            "conv_balance_ratio": _capacity_ratio(capacity, demand),
+            "conv_spare_tu": capacity - demand,
+        }
     )
-    df["conv_capacity_tu"] = df["conv_capacity_tu"].fillna(0.0)
-    df["conv_balance_ratio"] = df["conv_capacity_tu"] / df["uf6_demand_tu"]
-    df["conv_spare_tu"] = df["conv_capacity_tu"] - df["uf6_demand_tu"]
-    return df
+    return downcast(out, dtype)
 
 
 def compute_enrichment_balance(
@@ -42,15 +75,22 @@ def compute_enrichment_balance(
     enr_scenarios: pd.DataFrame | None,
     start_year: int,
     end_year: int,
+    dtype: str | None = None,
 ) -> pd.DataFrame:
-    """Compare SWU demand to enrichment capacity."""
+    """Compare SWU demand to enrichment capacity, optionally narrowed to ``dtype``."""
     cap = _apply_capacity_scenarios(enrichment_capacity, enr_scenarios, start_year, end_year)
-    demand = swu_demand[(swu_demand["year"] >= start_year) & (swu_demand["year"] <= end_year)]
+    swu = swu_demand[(swu_demand["year"] >= start_year) & (swu_demand["year"] <= end_year)]
 
-    df = demand[["year", "swu_demand_swu"]].merge(
-        cap.rename(columns={"swu_capacity_swu": "swu_capacity_swu"}), on="year", how="left"
+    years = swu["year"].to_numpy()
+    demand = swu["swu_demand_swu"].to_numpy(dtype=float)
+    capacity = _capacity_by_year(cap, "swu_capacity_swu", years)
+    out = pd.DataFrame(
+        {
+            "year": years,
+            "swu_demand_swu": demand,
+            "swu_capacity_swu": capacity,
+            "swu_balance_ratio": _capacity_ratio(capacity, demand),
+            "swu_spare_swu": capacity - demand,
+        }
     )
-    df["swu_capacity_swu"] = df["swu_capacity_swu"].fillna(0.0)
-    df["swu_balance_ratio"] = df["swu_capacity_swu"] / df["swu_demand_swu"]
-    df["swu_spare_swu"] = df["swu_capacity_swu"] - df["swu_demand_swu"]
-    return df
+    return downcast(out, dtype)
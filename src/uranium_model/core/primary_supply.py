@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from uranium_model.utils.vec import downcast
+
 
 def build_primary_supply(
     mines: pd.DataFrame,
@@ -13,12 +16,14 @@ def build_primary_supply(
     mine_scenarios: Optional[pd.DataFrame],
     start_year: int,
     end_year: int,
+    dtype: Optional[str] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Return mine-level and aggregated primary supply panel.
 
     Historical production is taken from ``mine_production`` when available.
     Scenario rows (already filtered for the scenario of interest) override or extend
-    future years. Missing years default to zero.
+    future years. Missing years default to zero. Both frames are cast to ``dtype``
+    (e.g. "float32") when given.
     """
     # Base from historical production
     base = mine_production.copy()
@@ -35,24 +40,31 @@ def build_primary_supply(
         # Scenario overrides by mine/year where provided
         base = pd.concat([base, scenario[["mine_id", "year", "production_tu"]]], ignore_index=True)
 
-    # Expand to ensure every mine has entries across the range
+    # Expand to ensure every mine has entries across the range: accumulate into a dense
+    # (mine, year) array, summing duplicate mine/year rows.
     mine_ids = mines["mine_id"].unique() if not mines.empty else base["mine_id"].unique()
-    all_years = range(start_year, end_year + 1)
-    template = pd.MultiIndex.from_product([mine_ids, all_years], names=["mine_id", "year"])
-
-    mine_year = (
-        base.set_index(["mine_id", "year"])["production_tu"]
-        .groupby(level=[0, 1])
-        .sum()
-        .reindex(template, fill_value=0)
-        .reset_index()
+    years = np.arange(start_year, end_year + 1)
+    mine_idx = pd.Categorical(base["mine_id"], categories=mine_ids).codes
+    year_idx = base["year"].to_numpy(dtype=np.int64) - start_year
+    known = mine_idx >= 0
+    production = np.zeros((len(mine_ids), len(years)))
+    np.add.at(
+        production,
+        (mine_idx[known], year_idx[known]),
+        np.nan_to_num(base["production_tu"].to_numpy(dtype=float)[known]),
+    )
+
+    mine_year = pd.DataFrame(
+        {
+            "mine_id": np.repeat(mine_ids, len(years)),
+            "year": np.tile(years, len(mine_ids)),
+            "production_tu": production.ravel(),
+        }
     )
 
     if not mines.empty:
         merge_cols = ["mine_id"] + (["country"] if "country" in mines.columns else [])
         mine_meta = mines[merge_cols].drop_duplicates("mine_id")
         mine_year = mine_year.merge(mine_meta, on="mine_id", how="left")
-    primary_supply = (
-        mine_year.groupby("year")["production_tu"].sum().reset_index().rename(columns={"production_tu": "primary_supply_tu"})
-    )
-    return mine_year, primary_supply
+    primary_supply = pd.DataFrame({"year": years, "primary_supply_tu": production.sum(axis=0)})
+    return downcast(mine_year, dtype), downcast(primary_supply, dtype)
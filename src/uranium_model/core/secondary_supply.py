@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+# Value columns summed per year in build_secondary_supply.
+SECONDARY_SUPPLY_COLUMNS = ("secondary_supply_tu", "heu_tu", "underfeeding_tu")
+
 
 def build_secondary_supply(
     secondary_supply_base: pd.DataFrame,
@@ -14,27 +18,33 @@ def build_secondary_supply(
     end_year: int,
 ) -> pd.DataFrame:
     """Combine baseline secondary supply with scenario overrides."""
-    base = secondary_supply_base.copy()
+    base = secondary_supply_base
     if not base.empty:
-        base = base[(base["year"] >= start_year) & (base["year"] <= end_year)]
+        base = base.loc[base["year"].between(start_year, end_year)]
 
-    scenario = secondary_scenarios.copy() if secondary_scenarios is not None else pd.DataFrame()
+    scenario = secondary_scenarios if secondary_scenarios is not None else pd.DataFrame()
     if not scenario.empty:
-        scenario = scenario[(scenario["year"] >= start_year) & (scenario["year"] <= end_year)]
-        base = pd.concat([base, scenario], ignore_index=True, sort=False)
+        scenario = scenario.loc[scenario["year"].between(start_year, end_year)]
 
     # Aggregate by year/category, defaulting missing values to zero.
-    if base.empty:
+    frames = [frame for frame in (base, scenario) if not frame.empty]
+    if not frames:
         return pd.DataFrame(columns=["year", "secondary_supply_tu"])
 
-    grouped = base.groupby("year")
-    secondary = grouped.agg(
-        secondary_supply_tu=("secondary_supply_tu", "sum"),
-        heu_tu=("heu_tu", "sum"),
-        underfeeding_tu=("underfeeding_tu", "sum"),
-    )
-    secondary = secondary.fillna(0).reset_index()
-    return secondary
+    # Sum each value column per year with a weighted bincount (NaN counts as 0).
+    codes, years = pd.factorize(np.concatenate([frame["year"].to_numpy() for frame in frames]), sort=True)
+    secondary = {"year": years}
+    for col in SECONDARY_SUPPLY_COLUMNS:
+        if not any(col in frame.columns for frame in frames):
+            raise KeyError(col)
+        values = np.concatenate(
+            [
+                frame[col].to_numpy(dtype=float) if col in frame.columns else np.zeros(len(frame))
+                for frame in frames
+            ]
+        )
+        secondary[col] = np.bincount(codes, weights=np.nan_to_num(values), minlength=len(years))
+    return pd.DataFrame(secondary)
 
 
 def evolve_inventories(
@@ -48,28 +58,24 @@ def evolve_inventories(
     if initial_inventories.empty:
         raise ValueError("initial_inventories must contain at least one row with 'year' and 'inventory_tu'")
 
-    stock = initial_inventories.sort_values("year").iloc[-1]["inventory_tu"]
-    start_year = int(initial_inventories["year"].max()) + 1
+    # Position (not label) of the latest year, so duplicate index labels are harmless.
+    latest = initial_inventories["year"].argmax()
+    stock = float(initial_inventories["inventory_tu"].iat[latest])
+    start_year = int(initial_inventories["year"].iat[latest]) + 1
     end_year = int(feed_demand_year["year"].max())
 
-    scenario = inventory_scenarios.copy() if inventory_scenarios is not None else pd.DataFrame()
-    scenario = scenario.set_index("year") if not scenario.empty else pd.DataFrame()
-
-    primary_series = primary_supply_year.set_index("year")["primary_supply_tu"] if not primary_supply_year.empty else pd.Series(dtype=float)
-    secondary_series = secondary_supply_year.set_index("year")["secondary_supply_tu"] if not secondary_supply_year.empty else pd.Series(dtype=float)
-    demand_series = feed_demand_year.set_index("year")["feed_tu"] if not feed_demand_year.empty else pd.Series(dtype=float)
+    years = np.arange(start_year, end_year + 1)
 
-    series = []
-    for year in range(start_year, end_year + 1):
-        primary = float(primary_series.get(year, 0.0))
-        secondary = float(secondary_series.get(year, 0.0))
-        demand = float(demand_series.get(year, 0.0))
+    def _by_year(frame: Optional[pd.DataFrame], column: str) -> np.ndarray:
+        if frame is None or frame.empty or column not in frame.columns:
+            return np.zeros(len(years))
+        by_year = frame.set_index("year")[column].reindex(years, fill_value=0.0)
+        return np.asarray(by_year.to_numpy(dtype=float), dtype=float)
 
-        policy_flow = 0.0
-        if not scenario.empty and year in scenario.index and "inventory_change_tu" in scenario.columns:
-            policy_flow = float(scenario.loc[year, "inventory_change_tu"])
-
-        stock = stock + primary + secondary - demand + policy_flow
-        series.append({"year": year, "inventory_tu": stock})
-
-    return pd.DataFrame(series)
+    flow = (
+        _by_year(primary_supply_year, "primary_supply_tu")
+        + _by_year(secondary_supply_year, "secondary_supply_tu")
+        - _by_year(feed_demand_year, "feed_tu")
+        + _by_year(inventory_scenarios, "inventory_change_tu")
+    )
+    return pd.DataFrame({"year": years, "inventory_tu": stock + np.cumsum(flow)})
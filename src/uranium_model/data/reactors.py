@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+# Reactor master columns stored as pandas categoricals.
+REACTOR_CATEGORICAL_COLUMNS = ["country", "reactor_type", "status", "fuel_type"]
+
 
 def build_reactor_master(pris_export: pd.DataFrame, geonuclear: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Normalize reactor master data.
@@ -49,6 +53,9 @@ def build_reactor_master(pris_export: pd.DataFrame, geonuclear: Optional[pd.Data
 
     df["commercial_operation_date"] = pd.to_datetime(df["commercial_operation_date"], errors="coerce")
     df["permanent_shutdown_date"] = pd.to_datetime(df["permanent_shutdown_date"], errors="coerce")
+    # Low-cardinality descriptors; reactor_id is unique per row here, so it stays a plain string.
+    for col in REACTOR_CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype("category")
 
     if geonuclear is not None and "reactor_id" in geonuclear.columns:
         geo_cols = [c for c in ["region", "subregion", "lat", "lon"] if c in geonuclear.columns]
@@ -78,6 +85,11 @@ def build_reactor_generation(pris_gen_export: pd.DataFrame) -> pd.DataFrame:
     df["net_generation_gwh"] = pd.to_numeric(df["net_generation_gwh"], errors="coerce")
     df["net_mwe"] = pd.to_numeric(df["net_mwe"], errors="coerce")
 
-    denom_gwh = df["net_mwe"] * 8760 / 1000  # MW * hours -> MWh -> GWh
-    df["capacity_factor"] = (df["net_generation_gwh"] / denom_gwh).clip(lower=0, upper=1)
+    gen_gwh = df["net_generation_gwh"].to_numpy(dtype=float)
+    mwe = df["net_mwe"].to_numpy(dtype=float)
+    # One masked divide into a NaN buffer, clipped in place; zero/negative capacity stays NaN.
+    cf = np.full(len(df), np.nan)
+    np.divide(gen_gwh, mwe * 8.76, out=cf, where=mwe > 0)  # MW * 8760 h / 1000 -> GWh
+    np.clip(cf, 0, 1, out=cf)
+    df["capacity_factor"] = cf
     return df[["reactor_id", "year", "net_generation_gwh", "capacity_factor", "net_mwe"]]
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
+from uranium_model.connections.postgres import read_sql_arrow
+from uranium_model.utils.vec import downcast
+
 # Canonical column sets for each table in the uxc schema.
 UXC_TABLE_COLUMNS: Dict[str, List[str]] = {
     "daily": [
@@ -59,9 +64,13 @@ UXC_COLUMN_RENAMES: Dict[str, Dict[str, str]] = {
     "weekly": {"u3o8_3yr_fwd": "yr_3_fwd_u3o8", "u3o8_5yr_fwd": "yr_5_fwd_u3o8"}
 }
 
+# Flag columns that are not averaged when aggregating to months in the database.
+UXC_NON_PRICE_COLUMNS: Set[str] = {"holiday"}
+
 
-def _get_available_columns(engine: Engine, schema: str = "uxc", table: str = "daily") -> Set[str]:
-    """Introspect available columns to avoid selecting missing fields."""
+@lru_cache(maxsize=64)
+def _get_available_columns(engine: Engine, schema: str = "uxc", table: str = "daily") -> FrozenSet[str]:
+    """Introspect available columns to avoid selecting missing fields (cached per engine/table)."""
     schema_name, table_name = (schema, table)
     query = text(
         """
@@ -72,7 +81,12 @@ def _get_available_columns(engine: Engine, schema: str = "uxc", table: str = "da
     )
     with engine.connect() as conn:
         cols = conn.execute(query, {"schema": schema_name, "table": table_name}).scalars().all()
-    return set(cols)
+    return frozenset(cols)
+
+
+def invalidate_uxc_schema_cache() -> None:
+    """Forget cached UxC column lists, e.g. after a schema migration or in tests."""
+    _get_available_columns.cache_clear()
 
 
 def load_uxc_prices(
@@ -83,6 +97,8 @@ def load_uxc_prices(
     table: str = "daily",
     schema: str = "uxc",
     rename_columns: bool = True,
+    monthly: bool = False,
+    dtype: Optional[str] = None,
 ) -> pd.DataFrame:
     """Query the UxC schema and return a price DataFrame indexed by date.
 
@@ -94,6 +110,12 @@ def load_uxc_prices(
         Schema to query (defaults to uxc).
     rename_columns:
         If True, applies light renames (e.g., weekly forward columns mapped to month_end naming).
+    monthly:
+        If True, average price columns to calendar-month starts in the database (the server-side
+        equivalent of ``to_monthly``) so only one row per month is transferred.
+    dtype:
+        Optional float dtype for the price columns, e.g. ``"float32"``. Quotes carry only a few
+        significant digits, and ``to_annual``/``build_price_features`` keep the narrower dtype.
     """
     table_key = table.lower()
     if table_key not in UXC_TABLE_COLUMNS:
@@ -113,30 +135,53 @@ def load_uxc_prices(
     if not cols:
         raise RuntimeError(f"No requested UxC columns found in {schema}.{table_key}")
 
-    select_cols = ["date"] + cols + (["insert_date"] if "insert_date" in available else [])
-    select_clause = ", ".join(select_cols)
+    if monthly:
+        price_cols = [c for c in cols if c not in UXC_NON_PRICE_COLUMNS]
+        select_clause = ", ".join(
+            ["date_trunc('month', date)::date as date"] + [f"avg({c}) as {c}" for c in price_cols]
+        )
+        group_clause = "group by 1"
+    else:
+        select_cols = ["date"] + cols + (["insert_date"] if "insert_date" in available else [])
+        select_clause = ", ".join(select_cols)
+        group_clause = ""
+
+    filters = []
+    params = {}
+    if start is not None:
+        filters.append("date >= cast(:start as date)")
+        params["start"] = start
+    if end is not None:
+        filters.append("date <= cast(:end as date)")
+        params["end"] = end
+    where_clause = f"where {' and '.join(filters)}" if filters else ""
     query = f"""
         select {select_clause}
         from {schema}.{table_key}
-        where (:start is null or date >= :start)
-          and (:end is null or date <= :end)
-        order by date
+        {where_clause}
+        {group_clause}
+        order by 1
     """
-    df = pd.read_sql_query(
-        sql=text(query),
-        con=engine,
-        params={"start": start, "end": end},
-    )
+    df = read_sql_arrow(engine, query, params)
+    if df is None:
+        df = pd.read_sql_query(sql=text(query), con=engine, params=params)
     if df.empty:
         return df
 
     df["date"] = pd.to_datetime(df["date"])
     df = df.set_index("date").sort_index()
+    # ADBC returns NUMERIC (including avg() over the monthly group) as strings; make prices floats.
+    for col in df.columns.intersection(cols).difference(list(UXC_NON_PRICE_COLUMNS)):
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col]).astype(np.float64)
+    if monthly:
+        # The group by only yields months that have rows; emit empty months as NaN like resample.
+        df = df.reindex(pd.date_range(df.index[0], df.index[-1], freq="MS", name="date"))
 
     if rename_columns and table_key in UXC_COLUMN_RENAMES:
         df = df.rename(columns=UXC_COLUMN_RENAMES[table_key])
 
-    return df
+    return downcast(df, dtype)
 
 
 def load_all_uxc_prices(
@@ -145,14 +190,24 @@ def load_all_uxc_prices(
     end: Optional[str] = None,
     schema: str = "uxc",
 ) -> Dict[str, pd.DataFrame]:
-    """Fetch daily, weekly, and month_end UxC tables with consistent naming."""
+    """Fetch daily, weekly, and month_end UxC tables with consistent naming.
+
+    The three queries run concurrently on separate pooled connections, so wall time is roughly
+    that of the slowest table rather than the sum.
+    """
+    tables = ("daily", "weekly", "month_end")
     frames: Dict[str, pd.DataFrame] = {}
-    for table in ("daily", "weekly", "month_end"):
-        try:
-            frames[table] = load_uxc_prices(engine, start=start, end=end, table=table, schema=schema)
-        except Exception as exc:  # noqa: BLE001 - surface but keep going
-            logging.warning("Failed to load %s.%s: %s", schema, table, exc)
-            frames[table] = pd.DataFrame()
+    with ThreadPoolExecutor(max_workers=len(tables)) as pool:
+        futures = {
+            table: pool.submit(load_uxc_prices, engine, start=start, end=end, table=table, schema=schema)
+            for table in tables
+        }
+        for table, future in futures.items():
+            try:
+                frames[table] = future.result()
+            except Exception as exc:  # noqa: BLE001 - surface but keep going
+                logging.warning("Failed to load %s.%s: %s", schema, table, exc)
+                frames[table] = pd.DataFrame()
     return frames
 
 
@@ -169,39 +224,43 @@ def to_annual(df: pd.DataFrame) -> pd.DataFrame:
     """Calendar-year average of each column."""
     if df.empty:
         return df
-    annual = df.groupby(df.index.year).mean(numeric_only=True)
+    # Bin by year start (no factorization of the timestamps); keep only years that have rows,
+    # as a groupby on the year would.
+    resampler = df.resample("YS")
+    annual = resampler.mean(numeric_only=True)[resampler.size() > 0]
+    annual.index = annual.index.year
     annual.index.name = "year"
     return annual
 
 
+# Spread features as (name, minuend, subtrahend); each is built only if both inputs exist.
+UXC_SPREAD_FEATURES: List[Tuple[str, str, str]] = [
+    ("term_spread_3y", "yr_3_fwd_u3o8", "u3o8_spot"),
+    ("term_spread_5y", "yr_5_fwd_u3o8", "u3o8_spot"),
+    ("lt_spread", "lt_u3o8", "u3o8_spot"),
+    ("conv_basis_na", "na_conv", "na_lt_conv"),
+    ("conv_basis_eu", "eu_conv", "eu_lt_conv"),
+    ("swu_spread", "lt_swu", "spot_swu"),
+    ("uf6_na_vs_u3o8", "na_uf6_value", "u3o8_spot"),
+    ("uf6_eu_vs_u3o8", "eu_uf6_value", "u3o8_spot"),
+]
+
+
 def build_price_features(df_annual: pd.DataFrame) -> pd.DataFrame:
     """Create derived price features used in regressions."""
     if df_annual.empty:
         return df_annual
 
-    out = df_annual.copy()
-
-    # Helper to avoid log of non-positive values.
-    def _safe_log(series: pd.Series) -> pd.Series:
-        return np.log(series.clip(lower=1e-9))
-
-    if "u3o8_spot" in out.columns:
-        out["log_u3o8_spot"] = _safe_log(out["u3o8_spot"])
-    if {"yr_3_fwd_u3o8", "u3o8_spot"}.issubset(out.columns):
-        out["term_spread_3y"] = out["yr_3_fwd_u3o8"] - out["u3o8_spot"]
-    if {"yr_5_fwd_u3o8", "u3o8_spot"}.issubset(out.columns):
-        out["term_spread_5y"] = out["yr_5_fwd_u3o8"] - out["u3o8_spot"]
-    if {"lt_u3o8", "u3o8_spot"}.issubset(out.columns):
-        out["lt_spread"] = out["lt_u3o8"] - out["u3o8_spot"]
-    if {"na_conv", "na_lt_conv"}.issubset(out.columns):
-        out["conv_basis_na"] = out["na_conv"] - out["na_lt_conv"]
-    if {"eu_conv", "eu_lt_conv"}.issubset(out.columns):
-        out["conv_basis_eu"] = out["eu_conv"] - out["eu_lt_conv"]
-    if {"lt_swu", "spot_swu"}.issubset(out.columns):
-        out["swu_spread"] = out["lt_swu"] - out["spot_swu"]
-    if {"na_uf6_value", "u3o8_spot"}.issubset(out.columns):
-        out["uf6_na_vs_u3o8"] = out["na_uf6_value"] - out["u3o8_spot"]
-    if {"eu_uf6_value", "u3o8_spot"}.issubset(out.columns):
-        out["uf6_eu_vs_u3o8"] = out["eu_uf6_value"] - out["u3o8_spot"]
-
-    return out
+    new: Dict[str, np.ndarray] = {}
+    if "u3o8_spot" in df_annual.columns:
+        # Clip to avoid log of non-positive values.
+        new["log_u3o8_spot"] = np.log(np.clip(df_annual["u3o8_spot"].to_numpy(), 1e-9, None))
+    for name, left, right in UXC_SPREAD_FEATURES:
+        if left in df_annual.columns and right in df_annual.columns:
+            new[name] = df_annual[left].to_numpy() - df_annual[right].to_numpy()
+
+    if not new:
+        return df_annual.copy()
+    # Replace features already present, e.g. when called on its own output.
+    base = df_annual.drop(columns=list(new), errors="ignore")
+    return pd.concat([base, pd.DataFrame(new, index=df_annual.index)], axis=1)
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
 def add_regime_flags(df: pd.DataFrame, regime_config: dict) -> pd.DataFrame:
     """Add boolean regime indicators based on year ranges."""
     out = df.copy()
-    for regime, cfg in regime_config.items():
-        start = cfg.get("start")
-        end = cfg.get("end")
-        if start is None:
-            continue
-        mask = out["year"] >= start
-        if end is not None:
-            mask &= out["year"] <= end
-        out[f"is_{regime}"] = mask.astype(int)
-    return out
+    regimes = {name: cfg for name, cfg in regime_config.items() if cfg.get("start") is not None}
+    if not regimes:
+        return out
+
+    # Open-ended regimes (no "end") run to +inf; all K windows are tested in one (N, K) broadcast.
+    starts = np.array([cfg["start"] for cfg in regimes.values()], dtype=float)
+    ends = np.array([np.inf if cfg.get("end") is None else cfg["end"] for cfg in regimes.values()], dtype=float)
+    years = out["year"].to_numpy(dtype=float)[:, None]
+    flags = ((years >= starts) & (years <= ends)).astype(np.int8)
+    return out.assign(**{f"is_{regime}": flags[:, k] for k, regime in enumerate(regimes)})
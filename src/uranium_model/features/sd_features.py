@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from uranium_model.features.regime_features import add_regime_flags
@@ -16,12 +17,21 @@ def build_annual_features(
     regime_config: Optional[dict],
 ) -> pd.DataFrame:
     """Merge balances with price features and regimes for regression."""
-    df = sd_panel.merge(uxc_annual_features.reset_index().rename(columns={"year": "year"}), on="year", how="left")
+    prices = uxc_annual_features
+    if prices.index.name != "year":
+        prices = prices.set_index("year")
+    df = sd_panel.set_index("year").join(prices, how="left", lsuffix="_x", rsuffix="_y")
 
     if contracting_metrics is not None and not contracting_metrics.empty:
-        df = df.merge(contracting_metrics, on="year", how="left")
-
-    df["secondary_share"] = df["secondary_supply_tu"] / df["total_supply_tu"]
+        df = df.join(contracting_metrics.set_index("year"), how="left", lsuffix="_x", rsuffix="_y")
+    df = df.reset_index()
+
+    # Share is 0 (not inf/NaN) in years without positive total supply.
+    secondary = df["secondary_supply_tu"].to_numpy(dtype=np.float64)
+    total = df["total_supply_tu"].to_numpy(dtype=np.float64)
+    share = np.zeros_like(secondary)
+    np.divide(secondary, total, out=share, where=total > 0)
+    df["secondary_share"] = share
     if regime_config:
         df = add_regime_flags(df, regime_config)
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -17,6 +17,15 @@ class PriceModelSpec:
     feature_cols: List[str]
     interaction_cols: List[str]
 
+    def __post_init__(self) -> None:
+        # Split "left:right" names once so fit/predict never re-parse them.
+        self._parsed_interactions: List[Tuple[str, str]] = []
+        for interaction in self.interaction_cols:
+            parts = interaction.split(":")
+            if len(parts) != 2:
+                raise ValueError(f"Interaction must look like 'left:right', got '{interaction}'")
+            self._parsed_interactions.append((parts[0], parts[1]))
+
 
 @dataclass
 class FittedPriceModel:
@@ -24,33 +33,61 @@ class FittedPriceModel:
     params: pd.Series
     cov: pd.DataFrame
 
+    def __post_init__(self) -> None:
+        # Resolve interaction operands to column positions once: predict reads the feature
+        # columns first, then any operand that is not itself a feature.
+        pairs = self.spec._parsed_interactions
+        operands = [col for pair in pairs for col in pair]
+        self._input_cols = list(dict.fromkeys(self.spec.feature_cols + operands))
+        position = {col: i for i, col in enumerate(self._input_cols)}
+        self._interaction_idx = [(position[left], position[right]) for left, right in pairs]
+        self._params_np = np.ascontiguousarray(self.params.to_numpy(dtype=np.float64))
+        self._has_const = "const" in self.params.index
+
     def predict(self, X: pd.DataFrame) -> pd.Series:
         """Predict price given a feature matrix."""
-        df = X.copy()
-        for interaction in self.spec.interaction_cols:
-            left, right = interaction.split(":")
-            df[interaction] = df[left] * df[right]
+        values = X[self._input_cols].to_numpy(dtype=np.float64)
+        n_features = len(self.spec.feature_cols)
+        offset = 1 if self._has_const else 0
 
-        X_design = df[self.spec.feature_cols + self.spec.interaction_cols]
-        X_design = sm.add_constant(X_design)
-        y_hat = np.dot(X_design.values, self.params.values)
+        design = np.empty((len(X), offset + n_features + len(self._interaction_idx)))
+        if offset:
+            design[:, 0] = 1.0
+        design[:, offset : offset + n_features] = values[:, :n_features]
+        for k, (left, right) in enumerate(self._interaction_idx):
+            np.multiply(values[:, left], values[:, right], out=design[:, offset + n_features + k])
+        y_hat = np.matmul(design, self._params_np)
 
         if self.spec.log_transform:
-            return np.exp(y_hat)
+            y_hat = np.exp(y_hat)
         return pd.Series(y_hat, index=X.index)
 
 
 def fit_price_model(features: pd.DataFrame, spec: PriceModelSpec) -> FittedPriceModel:
     """Fit OLS with optional log target and interaction terms."""
-    df = features.dropna(subset=[spec.target_col] + spec.feature_cols).copy()
+    # One float64 matrix of target, features and interaction operands; rows missing the target
+    # or a feature are dropped.
+    operands = [col for pair in spec._parsed_interactions for col in pair]
+    input_cols = list(dict.fromkeys(spec.feature_cols + operands))
+    position = {col: i for i, col in enumerate(input_cols)}
+    n_features = len(spec.feature_cols)
+
+    mat = features[[spec.target_col] + input_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    mat = mat[~np.isnan(mat[:, : 1 + n_features]).any(axis=1)]
+    y = np.log(mat[:, 0]) if spec.log_transform else mat[:, 0]
+    values = mat[:, 1:]
 
-    y = np.log(df[spec.target_col]) if spec.log_transform else df[spec.target_col]
-    for inter in spec.interaction_cols:
-        left, right = inter.split(":")
-        df[inter] = df[left] * df[right]
+    X = np.empty((len(mat), n_features + len(spec.interaction_cols)))
+    X[:, :n_features] = values[:, :n_features]
+    for k, (left, right) in enumerate(spec._parsed_interactions):
+        np.multiply(values[:, position[left]], values[:, position[right]], out=X[:, n_features + k])
 
-    X = df[spec.feature_cols + spec.interaction_cols]
-    X = sm.add_constant(X)
+    names = spec.feature_cols + spec.interaction_cols
+    X_const = sm.add_constant(X)
+    if X_const.shape[1] > X.shape[1]:  # add_constant skips if a column is already constant
+        names = ["const"] + names
 
-    model = sm.OLS(y, X).fit()
-    return FittedPriceModel(spec=spec, params=model.params, cov=model.cov_params())
+    model = sm.OLS(y, X_const).fit()
+    params = pd.Series(model.params, index=names)
+    cov = pd.DataFrame(model.cov_params(), index=names, columns=names)
+    return FittedPriceModel(spec=spec, params=params, cov=cov)
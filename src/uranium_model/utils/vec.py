@@ -0,0 +1,33 @@
+"""Column-wise NumPy helpers shared by the pandas pipelines."""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def spread_frame(df: pd.DataFrame, spreads: Mapping[str, Tuple[str, str]]) -> pd.DataFrame:
+    """Frame of ``df[left] - df[right]`` per output name, built from column arrays in one allocation."""
+    data = {name: df[left].to_numpy() - df[right].to_numpy() for name, (left, right) in spreads.items()}
+    return pd.DataFrame(data, index=df.index)
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sample std over ``window`` points; NaN until the window is full."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        out[window - 1 :] = windows.std(axis=1, ddof=1)
+    return out
+
+
+def downcast(df: pd.DataFrame, dtype: Optional[str]) -> pd.DataFrame:
+    """Cast float columns to ``dtype`` (e.g. "float32") and ``year`` to int32; no-op for None."""
+    if dtype is None:
+        return df
+    casts: Dict[str, str] = {col: dtype for col in df.select_dtypes("floating").columns}
+    if "year" in df.columns:
+        casts["year"] = "int32"
+    return df.astype(casts)
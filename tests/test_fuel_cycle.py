@@ -0,0 +1,12 @@
+import numpy as np
+
+from uranium_model.core.fuel_cycle import value_function
+
+
+def test_value_function_float32_matches_float64():
+    # Enrichment assays of interest: tails (~0.2%) through LEU product (~5%).
+    x = np.linspace(0.002, 0.05, 200)
+    exact = value_function(x)
+    approx = value_function(x.astype(np.float32))
+    assert approx.dtype == np.float32
+    np.testing.assert_allclose(approx, exact, rtol=1e-6)
@@ -0,0 +1,21 @@
+import pandas as pd
+
+from uranium_model.core.secondary_supply import evolve_inventories
+
+
+def test_evolve_inventories_concatenated_initial_inventories():
+    # pd.concat without ignore_index leaves duplicate index labels (0, 1, 0).
+    initial = pd.concat(
+        [
+            pd.DataFrame({"year": [2021, 2020], "inventory_tu": [100.0, 90.0]}),
+            pd.DataFrame({"year": [2019], "inventory_tu": [80.0]}),
+        ]
+    )
+    primary = pd.DataFrame({"year": [2022, 2023], "primary_supply_tu": [5.0, 5.0]})
+    secondary = pd.DataFrame({"year": [2022], "secondary_supply_tu": [1.0]})
+    feed = pd.DataFrame({"year": [2022, 2023], "feed_tu": [7.0, 7.0]})
+
+    out = evolve_inventories(initial, primary, secondary, feed, None)
+
+    assert out["year"].tolist() == [2022, 2023]
+    assert out["inventory_tu"].tolist() == [99.0, 97.0]